@@ -0,0 +1,67 @@
+/* Fused float32 -> int16 PCM conversion for the WAV hot path.
+ *
+ * The scalar loop is written so the compiler auto-vectorizes it at -O3
+ * (NEON on arm64, AVX2/SSE on x86): multiply, clamp and truncating cast
+ * map directly onto packed instructions, converting 4-8 samples per
+ * iteration instead of one. Semantics match the NumPy fallback in
+ * utils_audio.quantize_int16 (clip to [-32768, 32767], cast truncates
+ * toward zero).
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+static PyObject *
+pcm_convert(PyObject *self, PyObject *arg)
+{
+    Py_buffer view;
+    if (PyObject_GetBuffer(arg, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0)
+        return NULL;
+    if (view.format == NULL || view.format[0] != 'f' || view.itemsize != 4) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_TypeError,
+                        "pcm_convert expects a C-contiguous float32 buffer");
+        return NULL;
+    }
+
+    Py_ssize_t n = view.len / (Py_ssize_t)sizeof(float);
+    PyObject *out = PyBytes_FromStringAndSize(NULL, n * 2);
+    if (out == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+
+    const float *src = (const float *)view.buf;
+    int16_t *dst = (int16_t *)PyBytes_AS_STRING(out);
+    for (Py_ssize_t i = 0; i < n; i++) {
+        float v = src[i] * 32767.0f;
+        if (v > 32767.0f)
+            v = 32767.0f;
+        else if (v < -32768.0f)
+            v = -32768.0f;
+        dst[i] = (int16_t)v;
+    }
+
+    PyBuffer_Release(&view);
+    return out;
+}
+
+static PyMethodDef audio_ext_methods[] = {
+    {"pcm_convert", pcm_convert, METH_O,
+     "Convert a C-contiguous float32 buffer to little-endian int16 PCM bytes."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef audio_ext_module = {
+    PyModuleDef_HEAD_INIT,
+    "app._audio_ext",
+    "Vectorized float32 -> int16 PCM conversion.",
+    -1,
+    audio_ext_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__audio_ext(void)
+{
+    return PyModule_Create(&audio_ext_module);
+}
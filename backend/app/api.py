@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import pathlib
 import time
 import uuid
 
-from fastapi import APIRouter, HTTPException
+import numpy as np
 
-from .cache import AudioCache
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from .buffers import float32_pool
+from .cache import AudioCache, CachedAudio, NullCache
 from .config import settings
-from .model_manager import QueueFullError, get_manager
+from .metrics import TTS_CACHE_HITS, TTS_CACHE_MISSES, TTS_REQUEST_LATENCY
+from .model_manager import AdmissionTimeoutError, QueueFullError, get_manager
 from .schemas import (
     AudioFormat,
     HealthResponse,
@@ -17,8 +24,14 @@ from .schemas import (
     TTSResponse,
     VoiceResponse,
 )
-from .storage import storage
-from .utils_audio import audio_bytes_base64, convert_audio, waveform_duration
+from .storage import get_storage
+from .utils_audio import (
+    convert_audio,
+    pcm16_chunk_bytes,
+    streaming_wav_header,
+    waveform_duration,
+)
+from .utils_text import split_for_tts
 
 
 router = APIRouter()
@@ -47,11 +60,12 @@ async def list_voices(
 
 
 @router.post("/v1/tts", response_model=TTSResponse)
-async def synthesize(request: TTSRequest) -> TTSResponse:
-    if request.stream:
-        raise HTTPException(status_code=400, detail="streaming not implemented yet")
+async def synthesize(request: TTSRequest, raw_request: Request):
     manager = get_manager()
+    cache = raw_request.app.state.cache
     req_id = request.request_id or uuid.uuid4().hex
+    if request.stream:
+        return _stream_response(manager, request, req_id)
     start_time = time.perf_counter()
     LOGGER.info(
         "[tts] request_id=%s model=%s voice=%s language=%s format=%s",
@@ -61,22 +75,23 @@ async def synthesize(request: TTSRequest) -> TTSResponse:
         request.language.value,
         request.format.value,
     )
+    cache_key = cache._make_key(
+        request.model.value,
+        request.text,
+        request.voice,
+        request.language.value,
+        request.tone,
+        request.speed,
+        request.seed,
+        request.sample_rate,
+        request.format.value,
+    )
+    inflight_fut = None
     try:
-        cache_key = None
-        if cache:
-            cache_key = (
-                request.model.value,
-                request.text,
-                request.voice,
-                request.language.value,
-                request.tone,
-                request.speed,
-                request.seed,
-                request.sample_rate,
-                request.format.value,
-            )
-            cached = cache.get(cache_key)
+        try:
+            cached = await cache.aget(cache_key)
             if cached:
+                TTS_CACHE_HITS.inc()
                 cache_hits, cache_misses = cache.stats
                 LOGGER.info(
                     "[tts] cache hit request_id=%s hits=%s misses=%s",
@@ -84,10 +99,143 @@ async def synthesize(request: TTSRequest) -> TTSResponse:
                     cache_hits,
                     cache_misses,
                 )
-                audio_bytes, fmt, sr, duration = cached
-                return _build_response(req_id, fmt, sr, duration, audio_bytes)
+                TTS_REQUEST_LATENCY.labels(
+                    model=request.model.value,
+                    format=request.format.value,
+                    cache="hit",
+                ).observe(time.perf_counter() - start_time)
+                return _build_response(req_id, cached)
+            if cache.enabled:
+                TTS_CACHE_MISSES.inc()
+
+            pending = cache.inflight(cache_key)
+            if pending is not None:
+                LOGGER.info(
+                    "[tts] coalesced into in-flight request request_id=%s", req_id
+                )
+                entry = await pending
+                TTS_REQUEST_LATENCY.labels(
+                    model=request.model.value,
+                    format=request.format.value,
+                    cache="coalesced",
+                ).observe(time.perf_counter() - start_time)
+                return _build_response(req_id, entry)
+            inflight_fut = cache.register_inflight(cache_key)
+
+            # Long inputs are split at sentence/whitespace boundaries and
+            # synthesized in parallel, then concatenated in order; wall-clock
+            # latency drops by roughly the worker concurrency factor.
+            chunks = split_for_tts(request.text)
+            base_kwargs = dict(
+                model_name=request.model.value,
+                voice=request.voice,
+                language=request.language.value,
+                tone=request.tone,
+                seed=request.seed,
+                speed=request.speed,
+                sample_rate=request.sample_rate,
+            )
+            if len(chunks) <= 1:
+                audio, sample_rate = await manager.synthesize(
+                    text=request.text, **base_kwargs
+                )
+            else:
+                results = await asyncio.gather(
+                    *[manager.synthesize(text=chunk, **base_kwargs) for chunk in chunks]
+                )
+                sample_rate = results[0][1]
+                audio = np.concatenate([part for part, _ in results])
+                for part, _ in results:
+                    float32_pool.release(part)
+        except QueueFullError as exc:
+            LOGGER.warning("[tts] queue full request_id=%s", req_id)
+            if inflight_fut is not None:
+                cache.resolve_inflight(cache_key, inflight_fut, error=exc)
+            raise HTTPException(status_code=429, detail="queue full")
+        except AdmissionTimeoutError as exc:
+            LOGGER.warning("[tts] admission timeout request_id=%s", req_id)
+            if inflight_fut is not None:
+                cache.resolve_inflight(cache_key, inflight_fut, error=exc)
+            raise HTTPException(
+                status_code=503,
+                detail="server busy, retry later",
+                headers={"Retry-After": str(max(1, int(settings.admit_timeout_s)))},
+            )
+        except Exception as exc:
+            LOGGER.exception("[tts] request_id=%s error=%s", req_id, exc)
+            if inflight_fut is not None:
+                cache.resolve_inflight(cache_key, inflight_fut, error=exc)
+            raise HTTPException(
+                status_code=500,
+                detail=f"TTS failed: {exc!s}. Check server logs for traceback.",
+            ) from exc
+
+        try:
+            audio_bytes, fmt, sr = convert_audio(
+                audio, sample_rate, request.format.value
+            )
+            duration = waveform_duration(audio, sr)
+            # Encoded bytes are materialized; hand the waveform buffer back
+            # to the pool for the next request.
+            float32_pool.release(audio)
+
+            entry = CachedAudio(audio_bytes, fmt, sr, duration)
+            cache.put(cache_key, entry)
+            if inflight_fut is not None:
+                cache.resolve_inflight(cache_key, inflight_fut, result=entry)
+            if cache.enabled:
+                cache_hits, cache_misses = cache.stats
+                LOGGER.info(
+                    "[tts] cache store request_id=%s hits=%s misses=%s",
+                    req_id,
+                    cache_hits,
+                    cache_misses,
+                )
+
+            TTS_REQUEST_LATENCY.labels(
+                model=request.model.value,
+                format=request.format.value,
+                cache="miss" if cache.enabled else "off",
+            ).observe(time.perf_counter() - start_time)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            LOGGER.info(
+                "[tts] completed request_id=%s duration_ms=%.2f sample_rate=%s",
+                req_id,
+                elapsed,
+                sr,
+            )
+            return _build_response(req_id, entry)
+        except Exception as exc:
+            LOGGER.exception("[tts] request_id=%s post-synth error=%s", req_id, exc)
+            if inflight_fut is not None:
+                cache.resolve_inflight(cache_key, inflight_fut, error=exc)
+            raise HTTPException(
+                status_code=500,
+                detail=f"TTS failed: {exc!s}. Check server logs for traceback.",
+            ) from exc
+    finally:
+        if inflight_fut is not None and not inflight_fut.done():
+            # Client disconnects surface as CancelledError, which skips
+            # the except clauses above; fail the future here so coalesced
+            # waiters get an error instead of hanging on it forever.
+            cache.resolve_inflight(
+                cache_key,
+                inflight_fut,
+                error=RuntimeError("synthesis aborted before completion"),
+            )
+
 
-        audio, sample_rate = await manager.synthesize(
+def _stream_response(manager, request: TTSRequest, req_id: str) -> StreamingResponse:
+    """Chunked WAV response: header first, then int16 PCM as chunks arrive.
+
+    Streaming bypasses the cache — the response is consumed incrementally
+    and time-to-first-audio, not total cost, is what matters here.
+    """
+    LOGGER.info("[tts] streaming request_id=%s model=%s", req_id, request.model.value)
+
+    async def generator():
+        header_sent = False
+        async for chunk, sample_rate in manager.synthesize_stream(
             model_name=request.model.value,
             text=request.text,
             voice=request.voice,
@@ -96,68 +244,51 @@ async def synthesize(request: TTSRequest) -> TTSResponse:
             seed=request.seed,
             speed=request.speed,
             sample_rate=request.sample_rate,
-        )
-    except QueueFullError:
-        LOGGER.warning("[tts] queue full request_id=%s", req_id)
-        raise HTTPException(status_code=429, detail="queue full")
-    except Exception as exc:
-        LOGGER.exception("[tts] request_id=%s error=%s", req_id, exc)
-        raise HTTPException(
-            status_code=500,
-            detail=f"TTS failed: {exc!s}. Check server logs for traceback.",
-        ) from exc
+        ):
+            if not header_sent:
+                # The header is built from the pipeline's actual output
+                # rate, not the requested one — a mismatch would make the
+                # client decode at the wrong pitch and duration.
+                yield streaming_wav_header(sample_rate)
+                header_sent = True
+            yield pcm16_chunk_bytes(chunk)
+        if not header_sent:
+            # No chunks produced: still emit a valid (empty) WAV.
+            yield streaming_wav_header(request.sample_rate)
 
-    try:
-        audio_bytes, fmt, sr = convert_audio(
-            audio, sample_rate, request.format.value
-        )
-        duration = waveform_duration(audio, sr)
+    return StreamingResponse(
+        generator(),
+        media_type="audio/wav",
+        headers={"X-Request-ID": req_id},
+    )
 
-        if cache and cache_key:
-            cache.put(cache_key, (audio_bytes, fmt, sr, duration))
-            cache_hits, cache_misses = cache.stats
-            LOGGER.info(
-                "[tts] cache store request_id=%s hits=%s misses=%s",
-                req_id,
-                cache_hits,
-                cache_misses,
-            )
 
-        elapsed = (time.perf_counter() - start_time) * 1000
-        LOGGER.info(
-            "[tts] completed request_id=%s duration_ms=%.2f sample_rate=%s",
-            req_id,
-            elapsed,
-            sr,
-        )
-        return _build_response(req_id, fmt, sr, duration, audio_bytes)
-    except Exception as exc:
-        LOGGER.exception("[tts] request_id=%s post-synth error=%s", req_id, exc)
-        raise HTTPException(
-            status_code=500,
-            detail=f"TTS failed: {exc!s}. Check server logs for traceback.",
-        ) from exc
-
-
-def _build_response(
-    request_id: str, fmt: str, sample_rate: int, duration: float, audio_bytes: bytes
-) -> TTSResponse:
+def _build_response(request_id: str, entry: CachedAudio):
     if settings.output_mode == "base64":
-        return TTSResponse(
-            request_id=request_id,
-            audio_format=AudioFormat(fmt),
-            sample_rate=sample_rate,
-            duration_sec=duration,
-            audio_base64=audio_bytes_base64(audio_bytes),
+        # Emit a prebuilt dict straight through orjson: pydantic model
+        # construction and field re-validation add nothing for a payload
+        # we just assembled ourselves. entry.b64 memoizes the encoded
+        # string, so cache hits skip base64 entirely.
+        return ORJSONResponse(
+            {
+                "request_id": request_id,
+                "audio_format": entry.format,
+                "sample_rate": entry.sample_rate,
+                "duration_sec": entry.duration,
+                "audio_base64": entry.b64,
+                "audio_url": None,
+            }
         )
 
-    file_id = storage.save(audio_bytes, fmt)
+    if entry.audio_url is None:
+        file_id = get_storage().save(entry.audio_bytes, entry.format)
+        entry.audio_url = f"/v1/audio/{file_id}"
     return TTSResponse(
         request_id=request_id,
-        audio_format=AudioFormat(fmt),
-        sample_rate=sample_rate,
-        duration_sec=duration,
-        audio_url=f"/v1/audio/{file_id}",
+        audio_format=AudioFormat(entry.format),
+        sample_rate=entry.sample_rate,
+        duration_sec=entry.duration,
+        audio_url=entry.audio_url,
     )
 
 
@@ -165,7 +296,19 @@ def _build_response(
 async def get_audio(file_name: str):
     if settings.output_mode != "file":
         raise HTTPException(status_code=404, detail="file serving disabled")
-    return storage.serve(file_name)
+    return get_storage().serve(file_name)
 
 
-cache = AudioCache(settings.cache_size) if settings.enable_cache else None
+def build_cache() -> AudioCache | NullCache:
+    """Construct the app-wide cache; NullCache keeps the call sites branchless."""
+    if settings.enable_cache:
+        disk_path = None
+        if settings.enable_disk_cache:
+            disk_path = str(pathlib.Path(settings.output_dir) / "audio_cache")
+        return AudioCache(
+            settings.cache_size,
+            settings.cache_max_bytes,
+            disk_path=disk_path,
+            disk_max_bytes=settings.disk_cache_bytes,
+        )
+    return NullCache()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import queue
+from typing import Iterable, Tuple
+
+import numpy as np
+
+
+class Float32Pool:
+    """Pool of preallocated float32 waveform buffers.
+
+    Post-inference processing allocates a fresh multi-hundred-KB float32
+    array per request. Pooling buffers at a few standard waveform lengths
+    (1/3/5/10/30 s at 24 kHz) lets requests reuse memory instead of
+    churning the allocator. `acquire` hands out a view of the smallest
+    pooled buffer that fits; `release` returns the backing buffer once the
+    caller is done with the waveform.
+    """
+
+    DEFAULT_SIZES: Tuple[int, ...] = tuple(24000 * s for s in (1, 3, 5, 10, 30))
+
+    def __init__(self, sizes: Iterable[int] = DEFAULT_SIZES, per_size: int = 32):
+        self._pools = {
+            size: queue.LifoQueue(maxsize=per_size) for size in sorted(sizes)
+        }
+
+    def acquire(self, n: int) -> np.ndarray:
+        for size, pool in self._pools.items():
+            if size >= n:
+                try:
+                    buf = pool.get_nowait()
+                except queue.Empty:
+                    buf = np.empty(size, dtype=np.float32)
+                return buf[:n]
+        # Longer than any pooled size: plain allocation, never pooled.
+        return np.empty(n, dtype=np.float32)
+
+    def release(self, view: np.ndarray) -> None:
+        if view.dtype != np.float32:
+            return
+        base = view.base if view.base is not None else view
+        if not isinstance(base, np.ndarray) or base.ndim != 1:
+            return
+        pool = self._pools.get(base.shape[0])
+        if pool is None:
+            return
+        try:
+            pool.put_nowait(base)
+        except queue.Full:
+            pass
+
+
+float32_pool = Float32Pool()
@@ -1,37 +1,309 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import threading
 from collections import OrderedDict
-from typing import Hashable, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from .utils_audio import audio_bytes_base64
+
+try:  # optional on-disk L2 tier
+    import diskcache
+
+    HAS_DISKCACHE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_DISKCACHE = False
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _log_disk_error(future) -> None:
+    """Done-callback for deferred disk-tier operations.
+
+    The L2 tier is best effort, so failures must not propagate, but a
+    silently dying disk cache is undebuggable — surface the error in the
+    log instead of swallowing it.
+    """
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        LOGGER.warning("Disk cache operation failed: %s", exc)
+
+
+@dataclass
+class CachedAudio:
+    """A cached encoded clip plus its lazily-built response fields.
+
+    The base64 string is computed on first access and memoized on the
+    instance, so repeat hits in base64 output mode serve the stored
+    string instead of re-encoding the payload; the same applies to the
+    file URL once the clip has been saved.
+    """
+
+    audio_bytes: bytes
+    format: str
+    sample_rate: int
+    duration: float
+    audio_url: str | None = None
+    _b64: str | None = field(default=None, repr=False)
+
+    @property
+    def b64(self) -> str:
+        if self._b64 is None:
+            self._b64 = audio_bytes_base64(self.audio_bytes)
+        return self._b64
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.audio_bytes)
 
 
 class AudioCache:
-    def __init__(self, max_size: int = 32):
+    """Sharded, byte-budgeted LRU for encoded audio payloads.
+
+    The store is split into ``num_shards`` independent OrderedDicts, each
+    guarded by its own lock, so concurrent hits on different shards never
+    contend and every critical section stays O(1). The entry-count and
+    byte budgets are divided evenly across shards.
+    """
+
+    NUM_SHARDS = 8
+    enabled = True
+
+    def __init__(
+        self,
+        max_size: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        num_shards: int = NUM_SHARDS,
+        disk_path: str | None = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ):
         self.max_size = max_size
-        self._store: OrderedDict[Hashable, Tuple[bytes, str, int, float]] = (
-            OrderedDict()
+        self.max_bytes = max_bytes
+        self.num_shards = max(1, num_shards)
+        self._shard_max_size = max(1, max_size // self.num_shards)
+        self._shard_max_bytes = max(1, max_bytes // self.num_shards)
+        # Entries are (value, nbytes) so eviction can track the byte budget
+        # without re-measuring payloads.
+        self._shards: List[OrderedDict[bytes, Tuple[Any, int]]] = [
+            OrderedDict() for _ in range(self.num_shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(self.num_shards)]
+        self._shard_bytes = [0] * self.num_shards
+        self._hits = [0] * self.num_shards
+        self._misses = [0] * self.num_shards
+        # In-flight futures for request coalescing; only touched from the
+        # event loop, so no lock is needed.
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        # Optional L2 tier: survives restarts, absorbs L1 evictions.
+        self._disk = (
+            diskcache.Cache(disk_path, size_limit=disk_max_bytes)
+            if disk_path and HAS_DISKCACHE
+            else None
         )
-        self._hits = 0
-        self._misses = 0
-
-    def _make_key(self, *parts: Hashable) -> Hashable:
-        return parts
-
-    def get(self, key: Hashable):
-        if key not in self._store:
-            self._misses += 1
-            return None
-        value = self._store.pop(key)
-        self._store[key] = value
-        self._hits += 1
-        return value
-
-    def put(self, key: Hashable, value):
-        if key in self._store:
-            self._store.pop(key)
-        self._store[key] = value
-        if len(self._store) > self.max_size:
-            self._store.popitem(last=False)
+
+    def _make_key(self, *parts: Any) -> bytes:
+        """Digest the request-identifying fields into a fixed 16-byte key.
+
+        Hashing once up front keeps lookups O(1) regardless of text length
+        and yields a key that can be serialized for an external cache tier.
+        Each field is length-prefixed (with a distinct marker for None) so
+        field boundaries cannot be forged by NUL bytes or other separator
+        characters inside the request text.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            if part is None:
+                digest.update(b"\x00")
+                continue
+            data = str(part).encode("utf-8")
+            digest.update(b"\x01")
+            digest.update(len(data).to_bytes(4, "little"))
+            digest.update(data)
+        return digest.digest()
+
+    def _shard_index(self, key: bytes) -> int:
+        return key[0] % self.num_shards
+
+    def _l1_get(self, key: bytes):
+        idx = self._shard_index(key)
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            entry = shard.pop(key, None)
+            if entry is not None:
+                shard[key] = entry
+                self._hits[idx] += 1
+                return entry[0]
+        return None
+
+    def _record_disk_hit(self, key: bytes, value) -> None:
+        # Promote to L1 so the next hit skips the disk read.
+        self._l1_put(key, value)
+        idx = self._shard_index(key)
+        with self._locks[idx]:
+            self._hits[idx] += 1
+
+    def _record_miss(self, key: bytes) -> None:
+        idx = self._shard_index(key)
+        with self._locks[idx]:
+            self._misses[idx] += 1
+
+    def get(self, key: bytes):
+        """Synchronous lookup; the disk tier is consulted only off-loop.
+
+        Event-loop callers go through `aget`, which awaits the SQLite
+        read in the executor instead of stalling the loop on an L1 miss.
+        """
+        value = self._l1_get(key)
+        if value is not None:
+            return value
+        if self._disk is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                value = self._disk.get(key)
+                if value is not None:
+                    self._record_disk_hit(key, value)
+                    return value
+        self._record_miss(key)
+        return None
+
+    async def aget(self, key: bytes):
+        value = self._l1_get(key)
+        if value is not None:
+            return value
+        if self._disk is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                value = await loop.run_in_executor(None, self._disk.get, key)
+            except Exception as exc:
+                LOGGER.warning("Disk cache read failed: %s", exc)
+                value = None
+            if value is not None:
+                self._record_disk_hit(key, value)
+                return value
+        self._record_miss(key)
+        return None
+
+    def put(self, key: bytes, value):
+        self._l1_put(key, value)
+        if self._disk is not None:
+            # Off the event loop the SQLite write happens inline; inside a
+            # handler it is deferred to the default executor with a
+            # done-callback so write failures land in the log.
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    self._disk.set(key, value)
+                except Exception as exc:
+                    LOGGER.warning("Disk cache write failed: %s", exc)
+            else:
+                future = loop.run_in_executor(None, self._disk.set, key, value)
+                future.add_done_callback(_log_disk_error)
+
+    def _l1_put(self, key: bytes, value) -> None:
+        # CachedAudio knows its payload size; legacy tuple values keep the
+        # encoded bytes in slot 0.
+        nbytes = value.nbytes if isinstance(value, CachedAudio) else len(value[0])
+        idx = self._shard_index(key)
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            old = shard.pop(key, None)
+            if old is not None:
+                self._shard_bytes[idx] -= old[1]
+            shard[key] = (value, nbytes)
+            self._shard_bytes[idx] += nbytes
+            if len(shard) > self._shard_max_size:
+                self._evict_oldest(idx)
+            # Evict by actual payload size so the RSS ceiling is predictable
+            # regardless of clip length; always keep the newest entry.
+            while self._shard_bytes[idx] > self._shard_max_bytes and len(shard) > 1:
+                self._evict_oldest(idx)
+
+    def _evict_oldest(self, idx: int) -> None:
+        _, (_, nbytes) = self._shards[idx].popitem(last=False)
+        self._shard_bytes[idx] -= nbytes
+
+    def inflight(self, key: bytes) -> asyncio.Future | None:
+        """Return the future of an identical in-flight request, if any."""
+        return self._inflight.get(key)
+
+    def register_inflight(self, key: bytes) -> asyncio.Future:
+        """Register this request as the synthesizer for `key`.
+
+        Concurrent identical requests await the returned future instead of
+        launching their own synthesis.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def resolve_inflight(
+        self,
+        key: bytes,
+        future: asyncio.Future,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self._inflight.pop(key, None)
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+            # Retrieve immediately so an unawaited future does not log
+            # "exception was never retrieved" when no waiters exist.
+            future.exception()
+        else:
+            future.set_result(result)
+
+    @property
+    def current_bytes(self) -> int:
+        return sum(self._shard_bytes)
+
+    @property
+    def stats(self) -> Tuple[int, int]:
+        return sum(self._hits), sum(self._misses)
+
+
+class NullCache:
+    """Drop-in no-op cache used when caching is disabled.
+
+    Presents the same surface as AudioCache so callers need no
+    `if cache:` branches; every lookup misses and nothing is stored.
+    """
+
+    enabled = False
+
+    def _make_key(self, *parts: Any) -> bytes:
+        return b""
+
+    def get(self, key: bytes):
+        return None
+
+    async def aget(self, key: bytes):
+        return None
+
+    def put(self, key: bytes, value) -> None:
+        return None
+
+    def inflight(self, key: bytes):
+        return None
+
+    def register_inflight(self, key: bytes):
+        return None
+
+    def resolve_inflight(self, key, future, result=None, error=None) -> None:
+        return None
+
+    @property
+    def current_bytes(self) -> int:
+        return 0
 
     @property
     def stats(self) -> Tuple[int, int]:
-        return self._hits, self._misses
+        return 0, 0
@@ -22,16 +22,31 @@ def _get_bool(env_name: str, default: bool) -> bool:
 class Settings:
     device_preference: DeviceOption = os.getenv("TTS_DEVICE", "auto")  # type: ignore
     dtype_preference: DTypeOption = os.getenv("TTS_DTYPE", "auto")  # type: ignore
+    # Overrides the planned compute dtype for inference only, so ops can
+    # force fp16/fp32 without touching the device plan.
+    inference_dtype: DTypeOption = os.getenv("TTS_INFERENCE_DTYPE", "auto")  # type: ignore
     preload_models: bool = _get_bool("TTS_PRELOAD_MODELS", False)
+    warmup_on_load: bool = _get_bool("TTS_WARMUP_ON_LOAD", True)
     max_concurrency_per_model: int = int(
         os.getenv("TTS_MAX_CONCURRENCY_PER_MODEL", "1")
     )
     max_queue_size: int = int(os.getenv("TTS_MAX_QUEUE_SIZE", "32"))
+    max_batch_size: int = int(os.getenv("TTS_MAX_BATCH_SIZE", "4"))
+    batch_window_s: float = float(os.getenv("TTS_BATCH_WINDOW_S", "0.005"))
+    admit_timeout_s: float = float(os.getenv("TTS_ADMIT_TIMEOUT_S", "5.0"))
     output_mode: OutputMode = os.getenv("TTS_OUTPUT_MODE", "base64")  # type: ignore
     output_dir: str = os.getenv("TTS_OUTPUT_DIR", "generated_audio")
     max_text_length: int = int(os.getenv("TTS_MAX_TEXT_LENGTH", "600"))
     enable_cache: bool = _get_bool("TTS_ENABLE_CACHE", False)
     cache_size: int = int(os.getenv("TTS_CACHE_SIZE", "32"))
+    cache_max_bytes: int = int(
+        os.getenv("TTS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+    )
+    result_cache_size: int = int(os.getenv("TTS_RESULT_CACHE_SIZE", "16"))
+    enable_disk_cache: bool = _get_bool("TTS_ENABLE_DISK_CACHE", True)
+    disk_cache_bytes: int = int(
+        os.getenv("TTS_DISK_CACHE_BYTES", str(256 * 1024 * 1024))
+    )
     hf_home: str | None = os.getenv("HF_HOME")
     scalable_mode: bool = _get_bool("TTS_SCALABLE_MODE", True)
     default_sample_rate: int = int(os.getenv("TTS_DEFAULT_SAMPLE_RATE", "24000"))
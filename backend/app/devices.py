@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import cache
 from typing import Literal
 
 import torch
@@ -21,18 +22,26 @@ class DevicePlan:
     reason: str
 
 
+@cache
 def plan_device(
     device_pref: DeviceType | Literal["auto"],
     dtype_pref: DTypePref,
 ) -> DevicePlan:
-    # Resolve device
-    if device_pref == "mps" and torch.backends.mps.is_available():
+    """Resolve the device/dtype plan for the given preferences.
+
+    Memoized: preferences come from immutable settings, the answer never
+    changes within a process, and the torch backend availability probes
+    take a lock we do not want on repeated init paths.
+    """
+    # Resolve device; query MPS availability once.
+    mps_available = torch.backends.mps.is_available()
+    if device_pref == "mps" and mps_available:
         device = torch.device("mps")
         reason = "user forced mps"
     elif device_pref == "cpu":
         device = torch.device("cpu")
         reason = "user forced cpu"
-    elif torch.backends.mps.is_available():
+    elif mps_available:
         device = torch.device("mps")
         reason = "auto detected mps"
     else:
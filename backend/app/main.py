@@ -4,17 +4,23 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_fastapi_instrumentator import Instrumentator
 
 from . import api
 from .config import settings
 from .logging import setup_logging
-from .model_manager import get_manager
+from .model_manager import get_manager, get_manager_async
 
 
 def create_app() -> FastAPI:
     setup_logging(getattr(logging, settings.log_level.upper(), logging.INFO))
-    app = FastAPI(title="Qwen3-TTS Service")
+    # orjson serializes the multi-hundred-KB base64 payloads several times
+    # faster than the stdlib encoder, directly off the event loop.
+    app = FastAPI(title="Qwen3-TTS Service", default_response_class=ORJSONResponse)
+    app.state.cache = api.build_cache()
     app.include_router(api.router)
+    Instrumentator().instrument(app).expose(app)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -25,11 +31,16 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def startup_event():
-        manager = get_manager()
-        if settings.preload_models:
-            manager.preload_all()
+        # Preloading happens inside get_manager_async behind its init
+        # barrier, so concurrent first requests never duplicate the load.
+        manager = await get_manager_async()
         await manager.ensure_workers()
 
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        manager = get_manager()
+        manager.shutdown()
+
     return app
 
 
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Custom metrics complementing the per-route defaults added by
+# prometheus-fastapi-instrumentator in main.create_app. Counter/histogram
+# writes are cheap enough (~tens of ns) to sit on the request hot path.
+
+TTS_REQUEST_LATENCY = Histogram(
+    "tts_request_latency_seconds",
+    "End-to-end /v1/tts latency including synthesis and encoding",
+    labelnames=["model", "format", "cache"],
+)
+
+TTS_CACHE_HITS = Counter(
+    "tts_cache_hits_total",
+    "AudioCache hits on /v1/tts",
+)
+
+TTS_CACHE_MISSES = Counter(
+    "tts_cache_misses_total",
+    "AudioCache misses on /v1/tts",
+)
+
+TTS_QUEUE_DEPTH = Gauge(
+    "tts_queue_depth",
+    "Pending synthesis tasks in the per-model worker queue",
+    labelnames=["model"],
+)
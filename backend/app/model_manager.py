@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib
+import inspect
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from threading import Lock
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
 
 import numpy as np
 import torch
 
+from .buffers import float32_pool
 from .config import settings
 from .devices import plan_device
-from .utils_audio import ensure_mono, normalize_waveform
-from .worker import ModelWorker
+from .metrics import TTS_QUEUE_DEPTH
+from .utils_audio import ensure_mono, fold_mono_normalize
+from .worker import ModelWorker, QueueFullError
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +37,7 @@ VOICE_ALIAS_MAP: Dict[str, str] = {
     "english_male": "ryan",
 }
 
-SUPPORTED_QWEN_SPEAKERS: List[str] = [
+SUPPORTED_QWEN_SPEAKERS: Tuple[str, ...] = (
     "vivian",
     "serena",
     "uncle_fu",
@@ -40,48 +47,80 @@ SUPPORTED_QWEN_SPEAKERS: List[str] = [
     "aiden",
     "ono_anna",
     "sohee",
-]
+)
 
 
 def _to_numpy(audio: Any) -> np.ndarray:
-    """Convert pipeline output (torch.Tensor or array-like) to float32 numpy."""
-    if hasattr(audio, "cpu"):
-        audio = audio.cpu().numpy()
-    arr = np.asarray(audio, dtype=np.float32)
-    return arr
-
-
-def canonical_voice_name(name: str | None) -> str | None:
-    if not name:
-        return None
+    """Convert pipeline output (torch.Tensor or array-like) to numpy.
+
+    float16 output (the default dtype on MPS) is kept as-is rather than
+    eagerly upcast: the conversion to float32 happens exactly once, fused
+    with the copy into the pooled buffer in _finalize_waveform, halving
+    the bytes moved after inference.
+    """
+    if torch.is_tensor(audio):
+        # The copy must block: a non_blocking device->host transfer can
+        # return before the blit finishes, and the finalize pass reads the
+        # array immediately afterwards.
+        tensor = audio.detach().to("cpu")
+        if tensor.dtype not in (torch.float32, torch.float16):
+            tensor = tensor.float()
+        # contiguous() is a no-op on already-dense tensors, and guarantees
+        # .numpy() aliases the tensor storage instead of copying.
+        return tensor.contiguous().numpy()
+    arr = np.asarray(audio)
+    if arr.dtype in (np.float32, np.float16):
+        return arr
+    return arr.astype(np.float32)
+
+
+def _finalize_waveform(raw: Any) -> np.ndarray:
+    """Fold to mono and normalize into a pooled float32 buffer.
+
+    Writing the mono fold / normalization result into a buffer from
+    `float32_pool` avoids a fresh waveform-sized allocation per request;
+    the API layer releases the buffer after encoding.
+    """
+    arr = _to_numpy(raw)
+    if arr.ndim > 2:
+        raise ValueError("Unsupported audio shape")
+    n = arr.shape[0]
+    buf = float32_pool.acquire(n)
+    return fold_mono_normalize(arr, buf)
+
+
+@lru_cache(maxsize=256)
+def canonical_voice_name(name: str) -> str | None:
+    # The same handful of voice strings arrive on every request; memoizing
+    # turns strip/lower/lookup into a dict hit. Callers handle None inputs.
     normalized = str(name).strip()
     if not normalized:
         return None
     lowered = normalized.lower()
-    mapped = VOICE_ALIAS_MAP.get(lowered, lowered)
-    return mapped
+    return VOICE_ALIAS_MAP.get(lowered, lowered)
 
 
-def canonicalize_voice_list(voices: List[str]) -> List[str]:
+@lru_cache(maxsize=64)
+def canonicalize_voice_list(voices: Tuple[str, ...]) -> Tuple[str, ...]:
     seen: set[str] = set()
     ordered: List[str] = []
     for voice in voices:
-        canonical = canonical_voice_name(voice)
+        canonical = canonical_voice_name(voice) if voice else None
         if canonical and canonical not in seen:
             seen.add(canonical)
             ordered.append(canonical)
-    return ordered
+    return tuple(ordered)
 
 
-def augment_with_aliases(voices: List[str]) -> List[str]:
+@lru_cache(maxsize=64)
+def augment_with_aliases(voices: Tuple[str, ...]) -> Tuple[str, ...]:
     canonical = [voice for voice in voices if voice]
     seen = set(canonical)
     aliases: List[str] = []
     for alias, target in VOICE_ALIAS_MAP.items():
         if target in seen and alias not in seen and alias not in aliases:
             aliases.append(alias)
-    combined = canonical + aliases
-    return combined
+    return tuple(canonical + aliases)
 
 
 class QwenModelWrapper:
@@ -91,13 +130,22 @@ class QwenModelWrapper:
         device: torch.device,
         dtype: torch.dtype,
         fallback_voices: List[str] | None = None,
+        executor: ThreadPoolExecutor | None = None,
     ):
         self.model_id = model_id
         self.device = device
+        self.device_str = device.type
         self.dtype = dtype
-        self.fallback_voices = canonicalize_voice_list(fallback_voices or [])
+        self.fallback_voices = canonicalize_voice_list(tuple(fallback_voices or ()))
+        # None falls back to the loop's default executor; the manager
+        # normally passes its dedicated inference pool.
+        self._executor = executor
         self.pipeline = self._load_pipeline()
         self._voice_cache: List[str] | None = None
+        # Conditioning latents per speaker; populated lazily when the
+        # pipeline exposes an encoder hook (see _voice_conditioning).
+        self._voice_latent_cache: Dict[str, Any] = {}
+        self._accepts_voice_embedding_cached: bool | None = None
 
     def _load_pipeline(self):  # pragma: no cover - depends on external repo
         qwen_module = importlib.import_module("qwen_tts")
@@ -113,40 +161,181 @@ class QwenModelWrapper:
             kwargs["cache_dir"] = settings.hf_home
         if settings.hf_mirror:
             kwargs["mirror"] = settings.hf_mirror
-        if pipeline_cls.__name__ == "Qwen3TTSModel":
-            kwargs["torch_dtype"] = self.dtype
-        pipeline = pipeline_cls.from_pretrained(self.model_id, **kwargs)
+        # Materialize weights in the compute dtype directly: loading fp32
+        # and downcasting afterwards doubles peak memory during load.
+        kwargs["torch_dtype"] = self.dtype
+        try:
+            pipeline = pipeline_cls.from_pretrained(self.model_id, **kwargs)
+        except TypeError:
+            # Older pipeline classes reject torch_dtype.
+            kwargs.pop("torch_dtype")
+            pipeline = pipeline_cls.from_pretrained(self.model_id, **kwargs)
         self._maybe_move_pipeline(pipeline)
         return pipeline
 
     def _maybe_move_pipeline(self, pipeline):  # pragma: no cover - device shim
         if pipeline is None:
             return
+        moved = False
         if hasattr(pipeline, "to"):
             try:
                 pipeline.to(self.device)
-                return
+                moved = True
             except Exception as exc:  # noqa: PERF203
                 LOGGER.warning("Failed to move pipeline to %s: %s", self.device, exc)
         model = getattr(pipeline, "model", None)
-        if hasattr(model, "to"):
+        if not moved and hasattr(model, "to"):
             try:
                 model.to(self.device)
             except Exception as exc:  # noqa: PERF203
                 LOGGER.warning("Failed to move model to %s: %s", self.device, exc)
+        if hasattr(model, "eval"):
+            # Serving only: disable dropout/batch-norm training behaviour.
+            model.eval()
+
+    def warmup(self) -> None:
+        """Run one throwaway inference to pay first-call costs up front.
+
+        The first generate on a fresh pipeline triggers kernel compilation,
+        memory-pool growth and weight paging; doing it at load time keeps
+        those seconds out of the first user request. Failures only log —
+        warmup must never block serving.
+        """
+        try:
+            audio, _ = self._blocking_infer({"text": "Warm up."})
+            float32_pool.release(audio)
+        except Exception as exc:  # noqa: PERF203 - best effort by design
+            LOGGER.warning("Warmup inference failed for %s: %s", self.model_id, exc)
 
     async def synthesize(self, **kwargs) -> Tuple[np.ndarray, int]:
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._blocking_infer, kwargs)
+        return await loop.run_in_executor(self._executor, self._blocking_infer, kwargs)
+
+    async def synthesize_stream(
+        self, **kwargs
+    ) -> AsyncIterator[Tuple[np.ndarray, int]]:
+        """Yield (float32 chunk, sample rate) pairs as the pipeline emits them.
+
+        The blocking pipeline iterator runs in an executor thread and feeds
+        chunks through an asyncio.Queue so the event loop can flush each
+        frame to the client while synthesis is still in progress. The rate
+        is the pipeline's actual output rate, which callers need for the
+        WAV header — it can differ from the requested one.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[np.ndarray | None | Exception] = asyncio.Queue()
+
+        def producer() -> None:
+            try:
+                for chunk in self._blocking_infer_stream(kwargs):
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as exc:  # pragma: no cover - runtime path
+                loop.call_soon_threadsafe(queue.put_nowait, exc)
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        loop.run_in_executor(self._executor, producer)
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def _blocking_infer_stream(
+        self, kwargs: Dict[str, Any]
+    ) -> Iterator[Tuple[np.ndarray, int]]:
+        """Blocking generator of (float32 chunk, sample rate) pairs."""
+        if hasattr(self.pipeline, "generate_custom_voice"):
+            speaker = self._resolve_speaker(kwargs.get("voice"))
+            language = self._coerce_language(kwargs.get("language"))
+            with torch.inference_mode(), self._autocast():
+                stream = self.pipeline.generate_custom_voice(
+                    text=kwargs["text"],
+                    speaker=speaker,
+                    language=language,
+                    non_streaming_mode=False,
+                    **self._generate_kwargs(speaker),
+                )
+                for wav, sample_rate in stream:
+                    yield ensure_mono(_to_numpy(wav)), int(sample_rate)
+            return
+        # Pipelines without a streaming mode degrade to one full-waveform chunk.
+        yield self._blocking_infer(kwargs)
+
+    async def synthesize_batch(
+        self, kwargs_list: List[Dict[str, Any]]
+    ) -> List[Tuple[np.ndarray, int]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._blocking_infer_batch, kwargs_list
+        )
+
+    def _blocking_infer_batch(
+        self, kwargs_list: List[Dict[str, Any]]
+    ) -> List[Tuple[np.ndarray, int]]:
+        """Synthesize several requests, sharing forward passes where possible.
+
+        generate_custom_voice accepts a list of texts, so requests with the
+        same speaker and language are grouped into one batched call; anything
+        else falls back to per-request inference.
+        """
+        model = getattr(self.pipeline, "model", None)
+        model_type = getattr(model, "tts_model_type", "custom_voice")
+        if (
+            not hasattr(self.pipeline, "generate_custom_voice")
+            or model_type != "custom_voice"
+        ):
+            return [self._blocking_infer(kwargs) for kwargs in kwargs_list]
+
+        results: List[Tuple[np.ndarray, int] | None] = [None] * len(kwargs_list)
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        for i, kwargs in enumerate(kwargs_list):
+            key = (
+                self._resolve_speaker(kwargs.get("voice")),
+                self._coerce_language(kwargs.get("language")),
+            )
+            groups.setdefault(key, []).append(i)
+        with torch.inference_mode(), self._autocast():
+            for (speaker, language), indexes in groups.items():
+                wavs, sample_rate = self.pipeline.generate_custom_voice(
+                    text=[kwargs_list[i]["text"] for i in indexes],
+                    speaker=speaker,
+                    language=language,
+                    non_streaming_mode=True,
+                    **self._generate_kwargs(speaker),
+                )
+                for slot, wav in zip(indexes, wavs):
+                    results[slot] = (_finalize_waveform(wav), sample_rate)
+        return results  # type: ignore[return-value]
+
+    def _autocast(self):
+        """Half-precision autocast on MPS; a no-op everywhere else.
+
+        With fp16 weights and activations the attention/FFN matmuls move
+        half the bytes per step; the waveform is promoted once on the host
+        side (see _to_numpy), so output precision is unchanged in practice.
+        """
+        if self.device_str == "mps" and self.dtype in (
+            torch.float16,
+            torch.bfloat16,
+        ):
+            return torch.autocast(device_type="mps", dtype=self.dtype)
+        return contextlib.nullcontext()
 
     def _blocking_infer(self, kwargs: Dict[str, Any]) -> Tuple[np.ndarray, int]:
+        # inference_mode drops autograd bookkeeping (version counters, view
+        # metadata) entirely — a free win for a serving-only process.
+        with torch.inference_mode(), self._autocast():
+            return self._infer_impl(kwargs)
+
+    def _infer_impl(self, kwargs: Dict[str, Any]) -> Tuple[np.ndarray, int]:
         if hasattr(self.pipeline, "generate_custom_voice") or hasattr(
             self.pipeline, "generate_voice_design"
         ):
             wav, sample_rate = self._run_qwen3_model(kwargs)
-            audio = ensure_mono(_to_numpy(wav))
-            audio = normalize_waveform(audio)
-            return audio, sample_rate
+            return _finalize_waveform(wav), sample_rate
 
         result = self.pipeline.generate(
             text=kwargs["text"],
@@ -157,8 +346,7 @@ class QwenModelWrapper:
             speed=kwargs.get("speed", 1.0),
             sample_rate=kwargs.get("sample_rate"),
         )
-        audio = ensure_mono(_to_numpy(result["audio"]))
-        audio = normalize_waveform(audio)
+        audio = _finalize_waveform(result["audio"])
         sample_rate = result.get("sample_rate", kwargs.get("sample_rate"))
         return audio, sample_rate
 
@@ -174,6 +362,7 @@ class QwenModelWrapper:
                 speaker=speaker,
                 language=language,
                 non_streaming_mode=True,
+                **self._generate_kwargs(speaker),
             )
             return wavs[0], sample_rate
         if model_type == "voice_design":
@@ -189,8 +378,62 @@ class QwenModelWrapper:
             raise RuntimeError("Base voice-clone model is not supported yet")
         raise RuntimeError(f"Unsupported Qwen3-TTS model type {model_type}")
 
+    _VOICE_ENCODER_HOOKS = (
+        "compute_conditioning_latents",
+        "encode_voice",
+        "get_speaker_embedding",
+    )
+
+    def _voice_conditioning(self, speaker: str) -> Any | None:
+        """Return cached conditioning latents for a speaker, if supported.
+
+        Recomputing speaker conditioning dominates short-utterance latency
+        on pipelines that expose an encoder hook, so the first call per
+        voice pays the cost and later calls reuse the tensors. Pipelines
+        without such a hook (current upstream) simply get None.
+        """
+        cached = self._voice_latent_cache.get(speaker)
+        if cached is not None:
+            return cached
+        for hook_name in self._VOICE_ENCODER_HOOKS:
+            hook = getattr(self.pipeline, hook_name, None)
+            if callable(hook):
+                latents = hook(speaker)
+                self._voice_latent_cache[speaker] = latents
+                return latents
+        return None
+
+    def _accepts_voice_embedding(self) -> bool:
+        """Whether the pipeline's generate call takes a voice_embedding kwarg.
+
+        The signature is inspected once per wrapper; pipelines whose
+        generate call cannot be introspected are treated as unsupported
+        rather than risking a TypeError mid-synthesis.
+        """
+        cached = self._accepts_voice_embedding_cached
+        if cached is not None:
+            return cached
+        supported = False
+        generate = getattr(self.pipeline, "generate_custom_voice", None)
+        if callable(generate):
+            try:
+                params = inspect.signature(generate).parameters
+            except (TypeError, ValueError):
+                params = {}
+            supported = "voice_embedding" in params
+        self._accepts_voice_embedding_cached = supported
+        return supported
+
+    def _generate_kwargs(self, speaker: str) -> Dict[str, Any]:
+        if not self._accepts_voice_embedding():
+            return {}
+        latents = self._voice_conditioning(speaker)
+        if latents is None:
+            return {}
+        return {"voice_embedding": latents}
+
     def _resolve_speaker(self, requested: str | None) -> str:
-        canonical = canonical_voice_name(requested)
+        canonical = canonical_voice_name(requested) if requested else None
         if canonical:
             return canonical
         if self._voice_cache:
@@ -220,12 +463,11 @@ class QwenModelWrapper:
     def list_voices(self, refresh: bool = False) -> List[str]:
         if not refresh and self._voice_cache is not None:
             return self._voice_cache
-        voices = canonicalize_voice_list(self._extract_voices())
+        voices = canonicalize_voice_list(tuple(self._extract_voices()))
         if not voices:
             voices = self.fallback_voices or SUPPORTED_QWEN_SPEAKERS
-        voices = augment_with_aliases(voices)
-        self._voice_cache = voices
-        return voices
+        self._voice_cache = list(augment_with_aliases(voices))
+        return self._voice_cache
 
     def _extract_voices(self) -> List[str]:  # pragma: no cover - metadata path
         candidates: List[str] = []
@@ -279,6 +521,7 @@ class ModelManager:
         "qwen3-tts-0.6b": "Qwen/Qwen3-TTS-12Hz-0.6B-CustomVoice",
         "qwen3-tts-1.7b": "Qwen/Qwen3-TTS-12Hz-1.7B-CustomVoice",
     }
+    # Values are tuples so they can flow through the memoized voice helpers.
     DEFAULT_VOICES = {
         "qwen3-tts-0.6b": SUPPORTED_QWEN_SPEAKERS,
         "qwen3-tts-1.7b": SUPPORTED_QWEN_SPEAKERS,
@@ -288,9 +531,39 @@ class ModelManager:
         plan = plan_device(settings.device_preference, settings.dtype_preference)
         self.device = plan.device
         self.dtype = plan.dtype
+        if settings.inference_dtype == "float16":
+            self.dtype = torch.float16
+        elif settings.inference_dtype == "float32":
+            self.dtype = torch.float32
+        # torch.device.__getattr__ is surprisingly costly on hot paths;
+        # keep the type string resolved once.
+        self.device_str = self.device.type
         self.models: Dict[str, QwenModelWrapper] = {}
         self.workers: Dict[str, ModelWorker] = {}
+        self._admit: Dict[str, asyncio.Semaphore] = {}
         self._lock = Lock()
+        # Per-model locks so two different models can load concurrently
+        # while duplicate loads of the same model still serialize.
+        self._load_locks: Dict[str, Lock] = {
+            name: Lock() for name in self.MODEL_IDS
+        }
+        self._voice_snapshot: Dict[str, List[str]] = {}
+        # Waveform-level LRU: a hit skips the model forward pass entirely,
+        # which dwarfs every other saving in the request path.
+        self._result_cache: "OrderedDict[tuple, Tuple[np.ndarray, int]]" = (
+            OrderedDict()
+        )
+        self._result_cache_lock = asyncio.Lock()
+        # Inference gets its own bounded pool so it never queues behind
+        # unrelated I/O work on the loop's shared default executor.
+        infer_workers = max(1, settings.max_concurrency_per_model)
+        self._infer_pool = ThreadPoolExecutor(
+            max_workers=infer_workers, thread_name_prefix="tts-infer"
+        )
+        if self.device_str == "cpu":
+            # Keep MKL/OpenMP from oversubscribing cores when several
+            # inference threads run torch ops concurrently.
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // infer_workers))
         LOGGER.info(
             "ModelManager initialized device=%s dtype=%s", self.device, self.dtype
         )
@@ -299,22 +572,30 @@ class ModelManager:
         if model not in self.MODEL_IDS:
             raise ValueError(f"Unknown model {model}")
         if model not in self.models:
-            with self._lock:
+            with self._load_locks[model]:
                 if model not in self.models:
                     model_id = self.MODEL_IDS[model]
                     LOGGER.info("Loading model %s from %s", model, model_id)
-                    self.models[model] = QwenModelWrapper(
+                    wrapper = QwenModelWrapper(
                         model_id=model_id,
                         device=self.device,
                         dtype=self.dtype,
                         fallback_voices=self.DEFAULT_VOICES.get(model, []),
+                        executor=self._infer_pool,
                     )
-                    if settings.scalable_mode:
-                        self.workers[model] = ModelWorker(
-                            run_fn=self._worker_run,
-                            max_queue=settings.max_queue_size,
-                            workers=settings.max_concurrency_per_model,
-                        )
+                    if settings.warmup_on_load:
+                        wrapper.warmup()
+                    with self._lock:
+                        self.models[model] = wrapper
+                        if settings.scalable_mode:
+                            self.workers[model] = ModelWorker(
+                                run_fn=self._worker_run,
+                                max_queue=settings.max_queue_size,
+                                workers=settings.max_concurrency_per_model,
+                                run_batch_fn=self._worker_run_batch,
+                                max_batch=settings.max_batch_size,
+                                batch_window_s=settings.batch_window_s,
+                            )
         return self.models[model]
 
     async def ensure_workers(self) -> None:
@@ -322,53 +603,186 @@ class ModelManager:
             return
         await asyncio.gather(*[worker.start() for worker in self.workers.values()])
 
+    def shutdown(self) -> None:
+        """Release the dedicated inference pool.
+
+        Called from the app's shutdown hook so in-flight inferences finish
+        before the process exits instead of dying mid-generate.
+        """
+        self._infer_pool.shutdown(wait=True)
+
+    @staticmethod
+    def _result_cache_key(model_name: str, kwargs: Dict[str, Any]) -> tuple:
+        return (
+            model_name,
+            kwargs.get("text"),
+            kwargs.get("voice"),
+            kwargs.get("language"),
+            kwargs.get("tone"),
+            kwargs.get("seed"),
+            kwargs.get("speed", 1.0),
+            kwargs.get("sample_rate"),
+        )
+
     async def synthesize(self, model_name: str, **kwargs) -> Tuple[np.ndarray, int]:
+        cache_key = self._result_cache_key(model_name, kwargs)
+        if settings.result_cache_size > 0:
+            async with self._result_cache_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    audio, sample_rate = cached
+                    # Copy out: callers release waveforms into the buffer
+                    # pool after encoding, which would corrupt the cache.
+                    return np.copy(audio), sample_rate
         wrapper = self.get_or_load(model_name)
-        if settings.scalable_mode:
-            worker = self.workers[model_name]
-            await worker.start()
-            if worker.queue_full():
-                raise QueueFullError("queue full")
-            return await worker.enqueue({"wrapper": wrapper, "kwargs": kwargs})
-        return await wrapper.synthesize(**kwargs)
+        # Admission control: short bursts wait for a slot instead of being
+        # dropped; callers translate a timeout into 503 + Retry-After.
+        sem = self._admit.setdefault(
+            model_name, asyncio.Semaphore(settings.max_queue_size)
+        )
+        try:
+            await asyncio.wait_for(
+                sem.acquire(), timeout=settings.admit_timeout_s
+            )
+        except asyncio.TimeoutError:
+            raise AdmissionTimeoutError(
+                f"no synthesis slot for {model_name} within "
+                f"{settings.admit_timeout_s}s"
+            ) from None
+        try:
+            if settings.scalable_mode:
+                worker = self.workers[model_name]
+                await worker.start()
+                # enqueue itself raises QueueFullError on overflow; a
+                # separate fullness precheck would race with other waiters.
+                TTS_QUEUE_DEPTH.labels(model=model_name).set(worker.queue.async_q.qsize())
+                result = await worker.enqueue({"wrapper": wrapper, "kwargs": kwargs})
+            else:
+                result = await wrapper.synthesize(**kwargs)
+        finally:
+            sem.release()
+        if settings.result_cache_size > 0:
+            audio, sample_rate = result
+            async with self._result_cache_lock:
+                # Detach from the pooled buffer before storing (see above).
+                self._result_cache[cache_key] = (np.copy(audio), sample_rate)
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > settings.result_cache_size:
+                    self._result_cache.popitem(last=False)
+        return result
+
+    def synthesize_stream(
+        self, model_name: str, **kwargs
+    ) -> AsyncIterator[Tuple[np.ndarray, int]]:
+        # Streaming bypasses the worker queue: chunks must reach the client
+        # as they are produced, not after a queued slot frees up.
+        wrapper = self.get_or_load(model_name)
+        return wrapper.synthesize_stream(**kwargs)
 
     async def _worker_run(self, payload: Dict[str, Any]):
         wrapper = payload["wrapper"]
         kwargs = payload["kwargs"]
         return await wrapper.synthesize(**kwargs)
 
+    async def _worker_run_batch(self, payloads: List[Dict[str, Any]]):
+        # One worker serves one model, so every payload shares a wrapper.
+        wrapper = payloads[0]["wrapper"]
+        return await wrapper.synthesize_batch(
+            [payload["kwargs"] for payload in payloads]
+        )
+
     def preload_all(self):
-        for model_name in self.MODEL_IDS:
-            self.get_or_load(model_name)
+        # Threads are enough for parallel cold loads: from_pretrained spends
+        # most of its time in file I/O and tensor materialization, which
+        # release the GIL.
+        with ThreadPoolExecutor(
+            max_workers=len(self.MODEL_IDS), thread_name_prefix="tts-load"
+        ) as pool:
+            futures = {
+                pool.submit(self.get_or_load, name): name
+                for name in self.MODEL_IDS
+            }
+            for future in as_completed(futures):
+                future.result()
 
     def available_voices(self, model_name: str, refresh: bool = False) -> List[str]:
-        fallback = self.DEFAULT_VOICES.get(model_name, [])
+        fallback = self.DEFAULT_VOICES.get(model_name, ())
+        if model_name not in self.MODEL_IDS:
+            LOGGER.warning("Unknown model requested for voices: %s", model_name)
+            return list(fallback)
         wrapper = self.models.get(model_name)
+        if wrapper is None and not refresh:
+            # Listing voices must not trigger a multi-second model load:
+            # serve a static snapshot derived from the supported-speaker
+            # defaults until someone explicitly asks for a refresh.
+            snapshot = self._voice_snapshot.get(model_name)
+            if snapshot is None:
+                snapshot = list(
+                    augment_with_aliases(canonicalize_voice_list(tuple(fallback)))
+                )
+                self._voice_snapshot[model_name] = snapshot
+            return snapshot
         if wrapper is None:
-            if model_name not in self.MODEL_IDS:
-                LOGGER.warning("Unknown model requested for voices: %s", model_name)
-                return fallback
             try:
                 wrapper = self.get_or_load(model_name)
             except Exception as exc:  # pragma: no cover - load failure path
                 LOGGER.warning(
                     "Failed to load wrapper for voices %s: %s", model_name, exc
                 )
-                return fallback
+                return list(fallback)
         voices = wrapper.list_voices(refresh=refresh)
         if not voices:
             LOGGER.debug("No metadata voices found for %s, using fallback", model_name)
-            return fallback
+            return list(fallback)
         return voices
 
 
-class QueueFullError(Exception):
-    pass
+class AdmissionTimeoutError(Exception):
+    """No synthesis slot became free within the admission timeout."""
+
+
+_manager: ModelManager | None = None
+_manager_lock = Lock()
+_manager_ready = asyncio.Event()
+_manager_loading = False
 
 
-@lru_cache(maxsize=1)
 def get_manager() -> ModelManager:
-    manager = ModelManager()
-    if settings.preload_models:
-        manager.preload_all()
-    return manager
+    """Synchronous accessor; constructs the manager on first use.
+
+    Construction itself is cheap (device planning only) — model loading
+    happens in get_or_load or via get_manager_async at startup.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = ModelManager()
+    return _manager
+
+
+async def get_manager_async() -> ModelManager:
+    """Async accessor with an init barrier for preloading.
+
+    The first caller constructs the manager and runs preload_all in the
+    executor; concurrent callers await the ready event instead of piling
+    onto the loader, so cold start costs one load rather than N.
+    """
+    global _manager_loading
+    if _manager_ready.is_set():
+        return get_manager()
+    loop = asyncio.get_running_loop()
+    if not _manager_loading:
+        _manager_loading = True
+        try:
+            manager = await loop.run_in_executor(None, get_manager)
+            if settings.preload_models:
+                await loop.run_in_executor(None, manager.preload_all)
+        except Exception:
+            _manager_loading = False
+            raise
+        _manager_ready.set()
+        return manager
+    await _manager_ready.wait()
+    return get_manager()
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import base64
 import json
 import sys
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import List, Mapping, Sequence
 
 import httpx
 
+try:  # optional HTTP/2 support (httpx[http2])
+    import h2  # noqa: F401
+
+    HAS_HTTP2 = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_HTTP2 = False
+
 
 def _load_jobs(path: Path) -> Sequence[Mapping[str, object]]:
     try:
@@ -22,8 +30,11 @@ def _load_jobs(path: Path) -> Sequence[Mapping[str, object]]:
     return data
 
 
-def _write_audio(
-    request_id: str, payload: Mapping[str, object], out_dir: Path, client: httpx.Client
+async def _write_audio(
+    request_id: str,
+    payload: Mapping[str, object],
+    out_dir: Path,
+    client: httpx.AsyncClient,
 ) -> Path:
     audio_format = payload.get("audio_format")
     if not audio_format:
@@ -37,29 +48,54 @@ def _write_audio(
     audio_url = payload.get("audio_url")
     if not audio_url:
         raise RuntimeError(f"Response for {request_id} missing audio payload")
-    audio = client.get(str(audio_url))
+    audio = await client.get(str(audio_url))
     audio.raise_for_status()
     out_path.write_bytes(audio.content)
     return out_path
 
 
-def run_batch(
+async def run_batch_async(
     api_base: str,
     job_file: Path,
     output_dir: Path,
     timeout: float,
-) -> Iterable[Path]:
+    concurrency: int = 4,
+) -> List[Path]:
     jobs = _load_jobs(job_file)
     output_dir.mkdir(parents=True, exist_ok=True)
-    with httpx.Client(base_url=api_base, timeout=timeout) as client:
-        for job in jobs:
+    # One pooled connection set shared across all jobs; with HTTP/2 the
+    # in-flight requests multiplex over a single TCP stream.
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    async with httpx.AsyncClient(
+        base_url=api_base, timeout=timeout, http2=HAS_HTTP2, limits=limits
+    ) as client:
+
+        async def submit(job: Mapping[str, object]) -> Path:
             req_id = str(job.get("request_id") or "")
             if not req_id:
                 raise SystemExit("Each job must include request_id")
-            response = client.post("/v1/tts", json=job)
-            response.raise_for_status()
-            out_path = _write_audio(req_id, response.json(), output_dir, client)
-            yield out_path
+            async with semaphore:
+                response = await client.post("/v1/tts", json=job)
+                response.raise_for_status()
+                return await _write_audio(req_id, response.json(), output_dir, client)
+
+        return list(await asyncio.gather(*[submit(job) for job in jobs]))
+
+
+def run_batch(
+    api_base: str,
+    job_file: Path,
+    output_dir: Path,
+    timeout: float,
+    concurrency: int = 4,
+) -> List[Path]:
+    """Synchronous wrapper kept for callers that predate the async client."""
+    return asyncio.run(
+        run_batch_async(api_base, job_file, output_dir, timeout, concurrency)
+    )
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -77,10 +113,18 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser.add_argument(
         "--timeout", type=float, default=300, help="Request timeout seconds"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of requests kept in flight",
+    )
     args = parser.parse_args(argv)
 
     try:
-        for path in run_batch(args.api_base, args.batch, args.out_dir, args.timeout):
+        for path in run_batch(
+            args.api_base, args.batch, args.out_dir, args.timeout, args.concurrency
+        ):
             print(f"saved {path}")
         return 0
     except httpx.HTTPError as exc:
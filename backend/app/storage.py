@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import pathlib
 import uuid
+from functools import lru_cache
 from typing import Literal
 
 from fastapi import HTTPException
@@ -21,15 +22,28 @@ class AudioStorage:
     def save(self, audio_bytes: bytes, extension: str) -> str:
         file_id = f"{uuid.uuid4().hex}.{extension}"
         file_path = self.base_path / file_id
-        with open(file_path, "wb") as f:
-            f.write(audio_bytes)
+        # write_bytes is one open/write/close round trip; the buffered
+        # file-object dance adds a Python-level copy and extra syscalls.
+        file_path.write_bytes(audio_bytes)
         return file_id
 
     def serve(self, file_name: str) -> FileResponse:
         file_path = self.base_path / file_name
-        if not file_path.exists():
-            raise HTTPException(status_code=404, detail="Audio not found")
-        return FileResponse(file_path)
-
-
-storage = AudioStorage(settings.output_mode, settings.output_dir)
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            raise HTTPException(status_code=404, detail="Audio not found") from None
+        # Passing the stat saves FileResponse its own stat call; generated
+        # files are immutable (uuid names), so clients may cache for a day.
+        return FileResponse(
+            file_path,
+            stat_result=stat_result,
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> AudioStorage:
+    # Lazy singleton: importing this module no longer touches the
+    # filesystem (mkdir) — the directory is created on first use.
+    return AudioStorage(settings.output_mode, settings.output_dir)
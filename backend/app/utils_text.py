@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。！？])\s+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def split_for_tts(
+    text: str, lam_plus: int = 200, lam_minus: int = 60
+) -> List[str]:
+    """Split text into chunks suitable for parallel synthesis.
+
+    Sentences are the primary unit; anything longer than `lam_plus` chars
+    is recursively split at the whitespace nearest its midpoint, and
+    fragments shorter than `lam_minus` are merged with their neighbour so
+    the model never sees awkwardly tiny inputs. Splitting only at sentence
+    and whitespace boundaries keeps prosody intact.
+    """
+    stripped = text.strip()
+    if len(stripped) <= lam_plus:
+        return [stripped] if stripped else []
+    pieces: List[str] = []
+    for sentence in SENTENCE_SPLIT_RE.split(stripped):
+        if sentence:
+            pieces.extend(_split_long(sentence, lam_plus))
+    merged: List[str] = []
+    for piece in pieces:
+        if (
+            merged
+            and len(merged[-1]) < lam_minus
+            and len(merged[-1]) + len(piece) + 1 <= lam_plus
+        ):
+            merged[-1] = f"{merged[-1]} {piece}"
+        else:
+            merged.append(piece)
+    return merged
+
+
+def _split_long(sentence: str, lam_plus: int) -> List[str]:
+    if len(sentence) <= lam_plus:
+        return [sentence]
+    midpoint = len(sentence) // 2
+    cuts = [match.start() for match in WHITESPACE_RE.finditer(sentence)]
+    if not cuts:
+        return [sentence]
+    cut = min(cuts, key=lambda idx: abs(idx - midpoint))
+    left = sentence[:cut].rstrip()
+    right = sentence[cut:].lstrip()
+    if not left or not right:
+        return [sentence]
+    return _split_long(left, lam_plus) + _split_long(right, lam_plus)
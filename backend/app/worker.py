@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import janus
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a synthesis queue rejects a new task."""
 
 
 @dataclass
@@ -17,9 +23,19 @@ class ModelWorker:
         run_fn: Callable[[Dict[str, Any]], Awaitable[Any]],
         max_queue: int,
         workers: int,
+        run_batch_fn: Optional[
+            Callable[[List[Dict[str, Any]]], Awaitable[List[Any]]]
+        ] = None,
+        max_batch: int = 1,
+        batch_window_s: float = 0.005,
     ):
-        self.queue: asyncio.Queue[SynthesisTask] = asyncio.Queue(maxsize=max_queue)
+        # janus exposes sync and async ends over one buffer, so worker
+        # threads can push follow-up tasks without a loop-callback hop.
+        self.queue: janus.Queue[SynthesisTask] = janus.Queue(maxsize=max_queue)
         self.run_fn = run_fn
+        self.run_batch_fn = run_batch_fn
+        self.max_batch = max(1, max_batch)
+        self.batch_window_s = batch_window_s
         self.worker_tasks: list[asyncio.Task] = []
         self.num_workers = max(1, workers)
 
@@ -31,21 +47,63 @@ class ModelWorker:
 
     async def _worker_loop(self) -> None:
         while True:
-            task = await self.queue.get()
+            task = await self.queue.async_q.get()
+            batch = [task]
+            # Drain whatever is already queued so concurrent requests can
+            # share one batched forward pass instead of serializing, then
+            # linger briefly for stragglers: requests arriving within a few
+            # milliseconds of each other still join the same batch, at a
+            # latency cost far below one forward pass.
+            if self.run_batch_fn is not None:
+                while len(batch) < self.max_batch and not self.queue.async_q.empty():
+                    batch.append(self.queue.async_q.get_nowait())
+                while len(batch) < self.max_batch and self.batch_window_s > 0:
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(
+                                self.queue.async_q.get(), timeout=self.batch_window_s
+                            )
+                        )
+                    except asyncio.TimeoutError:
+                        break
+            # Waiter futures may already be cancelled (client disconnect,
+            # or gather() cancelling sibling chunks); an unguarded set_*
+            # would raise InvalidStateError and kill the worker loop.
+            if len(batch) == 1:
+                try:
+                    result = await self.run_fn(task.payload)
+                    if not task.future.done():
+                        task.future.set_result(result)
+                except Exception as exc:  # pragma: no cover - runtime path
+                    if not task.future.done():
+                        task.future.set_exception(exc)
+                finally:
+                    self.queue.async_q.task_done()
+                continue
             try:
-                result = await self.run_fn(task.payload)
-                task.future.set_result(result)
+                results = await self.run_batch_fn([t.payload for t in batch])
+                for item, result in zip(batch, results):
+                    if not item.future.done():
+                        item.future.set_result(result)
             except Exception as exc:  # pragma: no cover - runtime path
-                task.future.set_exception(exc)
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(exc)
             finally:
-                self.queue.task_done()
+                for _ in batch:
+                    self.queue.async_q.task_done()
 
     async def enqueue(self, payload: Dict[str, Any]) -> Any:
         loop = asyncio.get_running_loop()
         future: asyncio.Future = loop.create_future()
         task = SynthesisTask(payload=payload, future=future)
-        self.queue.put_nowait(task)
+        # put_nowait is the admission check: a check-then-put pair would
+        # race against concurrent enqueuers between the two steps.
+        try:
+            self.queue.async_q.put_nowait(task)
+        except asyncio.QueueFull:
+            raise QueueFullError("queue full") from None
         return await future
 
     def queue_full(self) -> bool:
-        return self.queue.full()
+        return self.queue.async_q.full()
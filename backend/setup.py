@@ -0,0 +1,35 @@
+"""Build hooks for the optional audio C extension.
+
+The extension is a pure speedup: when no compiler is available the build
+logs and continues, and utils_audio falls back to the NumPy path.
+"""
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+
+class optional_build_ext(build_ext):
+    def run(self):
+        try:
+            super().run()
+        except Exception as exc:  # pragma: no cover - toolchain dependent
+            print(f"Skipping optional C extension build: {exc}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as exc:  # pragma: no cover - toolchain dependent
+            print(f"Skipping optional C extension {ext.name}: {exc}")
+
+
+setup(
+    ext_modules=[
+        Extension(
+            "app._audio_ext",
+            sources=["app/_audio_ext.c"],
+            extra_compile_args=["-O3"],
+            optional=True,
+        )
+    ],
+    cmdclass={"build_ext": optional_build_ext},
+)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from app.buffers import Float32Pool
+
+
+def test_pool_reuses_released_buffer():
+    pool = Float32Pool(sizes=(100,), per_size=4)
+    view = pool.acquire(80)
+    assert view.shape == (80,)
+    backing = view.base
+    pool.release(view)
+    again = pool.acquire(50)
+    assert again.base is backing
+
+
+def test_pool_oversized_request_not_pooled():
+    pool = Float32Pool(sizes=(100,), per_size=4)
+    big = pool.acquire(500)
+    assert big.shape == (500,)
+    assert big.dtype == np.float32
+    pool.release(big)  # no matching pool; silently dropped
+    assert pool.acquire(500).base is None
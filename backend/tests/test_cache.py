@@ -0,0 +1,120 @@
+from app.cache import AudioCache
+
+
+def test_cache_byte_budget_eviction():
+    cache = AudioCache(max_size=32, max_bytes=100, num_shards=1)
+    for i in range(4):
+        key = cache._make_key("model", f"text-{i}")
+        cache.put(key, (b"x" * 40, "wav", 24000, 1.0))
+
+    # 4 x 40 bytes exceeds the 100-byte budget; oldest entries evicted.
+    assert cache.current_bytes <= 100
+    assert cache.get(cache._make_key("model", "text-0")) is None
+    assert cache.get(cache._make_key("model", "text-3")) is not None
+
+
+def test_cache_key_field_boundaries():
+    cache = AudioCache(num_shards=1)
+    # A NUL byte inside a field must not merge with the next field.
+    assert cache._make_key("a\x00b", None) != cache._make_key("a", "b")
+    # None and the empty string are distinct cache identities.
+    assert cache._make_key(None) != cache._make_key("")
+    assert cache._make_key("x", None) != cache._make_key("x", "")
+    # Identical inputs still map to identical keys.
+    assert cache._make_key("m", "t", None) == cache._make_key("m", "t", None)
+
+
+def test_cache_lru_order():
+    cache = AudioCache(max_size=2, num_shards=1)
+    k1 = cache._make_key("a")
+    k2 = cache._make_key("b")
+    k3 = cache._make_key("c")
+    cache.put(k1, (b"1", "wav", 24000, 1.0))
+    cache.put(k2, (b"2", "wav", 24000, 1.0))
+    assert cache.get(k1) is not None  # refresh k1
+    cache.put(k3, (b"3", "wav", 24000, 1.0))
+    assert cache.get(k2) is None  # k2 was the least recently used
+    assert cache.get(k1) is not None
+
+
+def test_cache_disk_tier_survives_l1_eviction(tmp_path):
+    import asyncio
+
+    import pytest
+
+    pytest.importorskip("diskcache")
+    cache = AudioCache(
+        max_size=1, num_shards=1, disk_path=str(tmp_path / "l2")
+    )
+    k1 = cache._make_key("a")
+    k2 = cache._make_key("b")
+    cache.put(k1, (b"first", "wav", 24000, 1.0))
+    cache.put(k2, (b"second", "wav", 24000, 1.0))  # evicts k1 from L1
+
+    # k1 is gone from L1 but still served from the disk tier.
+    assert cache.get(k1) == (b"first", "wav", 24000, 1.0)
+
+    # The async path reads the disk tier through the executor and
+    # promotes the hit back to L1.
+    cache2 = AudioCache(
+        max_size=1, num_shards=1, disk_path=str(tmp_path / "l2")
+    )
+
+    async def lookup():
+        return await cache2.aget(k2)
+
+    assert asyncio.run(lookup()) == (b"second", "wav", 24000, 1.0)
+    assert cache2.get(k2) is not None  # promoted, no disk read needed
+
+
+def test_cache_inflight_coalescing():
+    import asyncio
+
+    async def scenario():
+        cache = AudioCache()
+        key = cache._make_key("model", "text")
+        assert cache.inflight(key) is None
+        fut = cache.register_inflight(key)
+        assert cache.inflight(key) is fut
+
+        waiter = asyncio.ensure_future(cache.inflight(key))
+        cache.resolve_inflight(key, fut, result=(b"wav", "wav", 24000, 1.0))
+        assert await waiter == (b"wav", "wav", 24000, 1.0)
+        assert cache.inflight(key) is None
+
+    asyncio.run(scenario())
+
+
+def test_cache_concurrent_puts():
+    import threading
+
+    cache = AudioCache(max_size=64, max_bytes=1 << 20)
+
+    def writer(tag: int):
+        for i in range(200):
+            key = cache._make_key(tag, i)
+            cache.put(key, (b"x" * 16, "wav", 24000, 1.0))
+            cache.get(key)
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    hits, misses = cache.stats
+    assert hits + misses == 800
+    assert cache.current_bytes <= 64 * 16
+
+
+def test_cached_audio_b64_is_memoized():
+    import base64
+
+    from app.cache import CachedAudio
+
+    entry = CachedAudio(b"RIFFdata", "wav", 24000, 1.0)
+    assert entry._b64 is None
+    first = entry.b64
+    assert first == base64.b64encode(b"RIFFdata").decode("ascii")
+    # Second access serves the stored string, not a fresh encode.
+    assert entry.b64 is first
@@ -12,3 +12,27 @@ def test_health_endpoint():
     payload = resp.json()
     assert payload["status"] == "ok"
     assert "device" in payload
+
+
+def test_metrics_endpoint():
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert "tts_cache_hits_total" in resp.text
+
+
+def test_orjson_is_default_response_class():
+    from fastapi.responses import ORJSONResponse
+
+    assert app.router.default_response_class is ORJSONResponse
+
+
+def test_api_module_imported_once():
+    # Guards against a second copy of app.api/app.main sneaking back in:
+    # duplicate modules shadow each other's router and cache under reload.
+    import sys
+
+    from app import api
+
+    api_modules = [name for name in sys.modules if name.endswith("app.api")]
+    assert api_modules == ["app.api"]
+    assert sys.modules["app.api"] is api
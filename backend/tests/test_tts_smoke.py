@@ -4,7 +4,7 @@ import numpy as np
 from fastapi.testclient import TestClient
 
 from app import api as api_module
-from app.api import AudioCache
+from app.api import AudioCache, CachedAudio
 from app.main import app
 
 
@@ -26,12 +26,40 @@ def test_tts_smoke(mock_synth):
     assert "audio_base64" in data
 
 
+def test_tts_stream_smoke(monkeypatch):
+    import struct
+
+    async def fake_stream(self, model_name, **kwargs):
+        # Pipeline emits 16 kHz regardless of the requested rate.
+        yield np.zeros(2400, dtype=np.float32), 16000
+        yield np.ones(2400, dtype=np.float32) * 0.5, 16000
+
+    monkeypatch.setattr(
+        "app.model_manager.ModelManager.synthesize_stream", fake_stream
+    )
+    payload = {
+        "text": "hello world",
+        "model": "qwen3-tts-0.6b",
+        "language": "en",
+        "stream": True,
+    }
+    resp = client.post("/v1/tts", json=payload)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("audio/wav")
+    assert resp.content.startswith(b"RIFF")
+    # 44-byte header + 2 chunks of 2400 int16 samples
+    assert len(resp.content) == 44 + 2 * 2400 * 2
+    # The header advertises the pipeline's actual rate, not the requested
+    # default of 24000.
+    assert struct.unpack_from("<I", resp.content, 24)[0] == 16000
+
+
 def test_tts_cache_hit(monkeypatch):
     test_cache = AudioCache(max_size=4)
-    monkeypatch.setattr(api_module, "cache", test_cache)
+    monkeypatch.setattr(app.state, "cache", test_cache)
 
     # Pre-populate cache with expected key payload
-    cache_key = (
+    cache_key = test_cache._make_key(
         "qwen3-tts-0.6b",
         "hello world",
         None,
@@ -42,8 +70,7 @@ def test_tts_cache_hit(monkeypatch):
         24000,
         "wav",
     )
-    wav_bytes = b"RIFF...."
-    test_cache.put(cache_key, (wav_bytes, "wav", 24000, 1.0))
+    test_cache.put(cache_key, CachedAudio(b"RIFF....", "wav", 24000, 1.0))
 
     payload = {"text": "hello world", "model": "qwen3-tts-0.6b", "language": "en"}
     resp = client.post("/v1/tts", json=payload)
@@ -53,6 +80,46 @@ def test_tts_cache_hit(monkeypatch):
     assert data["audio_base64"] is not None
 
 
+def test_tts_inflight_resolved_on_abort(monkeypatch):
+    import pytest
+
+    test_cache = AudioCache(max_size=4)
+    monkeypatch.setattr(app.state, "cache", test_cache)
+
+    class Abort(BaseException):
+        """Bypasses `except Exception`, like a client-disconnect cancel."""
+
+    calls = {"n": 0}
+
+    async def flaky_synth(self, model_name, **kwargs):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise Abort()
+        return np.zeros(2400, dtype=np.float32), 24000
+
+    monkeypatch.setattr("app.model_manager.ModelManager.synthesize", flaky_synth)
+    payload = {"text": "hello world", "model": "qwen3-tts-0.6b", "language": "en"}
+    with pytest.raises(Abort):
+        client.post("/v1/tts", json=payload)
+    # The aborted leader must not leave a pending in-flight future behind:
+    # a retry has to synthesize fresh instead of coalescing and hanging.
+    assert not test_cache._inflight
+    resp = client.post("/v1/tts", json=payload)
+    assert resp.status_code == 200
+    assert calls["n"] == 2
+
+
+@patch("app.model_manager.ModelManager.synthesize")
+def test_tts_admission_timeout(mock_synth):
+    from app.model_manager import AdmissionTimeoutError
+
+    mock_synth.side_effect = AdmissionTimeoutError("no slot")
+    payload = {"text": "hello world", "model": "qwen3-tts-0.6b", "language": "en"}
+    resp = client.post("/v1/tts", json=payload)
+    assert resp.status_code == 503
+    assert "Retry-After" in resp.headers
+
+
 def test_list_voices_endpoint(monkeypatch):
     class DummyManager:
         def available_voices(self, model_name: str, refresh: bool = False):
@@ -64,3 +131,49 @@ def test_list_voices_endpoint(monkeypatch):
     resp = client.get("/v1/voices")
     assert resp.status_code == 200
     assert resp.json()["voices"] == ["v1", "v2"]
+
+
+def test_result_cache_skips_recompute(monkeypatch):
+    import asyncio
+
+    from app.config import settings
+    from app.model_manager import ModelManager
+
+    monkeypatch.setattr(settings, "scalable_mode", False)
+    monkeypatch.setattr(settings, "result_cache_size", 4)
+
+    calls = {"n": 0}
+
+    class DummyWrapper:
+        async def synthesize(self, **kwargs):
+            calls["n"] += 1
+            return np.full(100, 0.5, dtype=np.float32), 24000
+
+    manager = ModelManager()
+    monkeypatch.setattr(manager, "get_or_load", lambda name: DummyWrapper())
+
+    async def scenario():
+        first, _ = await manager.synthesize(
+            "qwen3-tts-0.6b", text="hi", sample_rate=24000
+        )
+        second, _ = await manager.synthesize(
+            "qwen3-tts-0.6b", text="hi", sample_rate=24000
+        )
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert calls["n"] == 1
+    np.testing.assert_array_equal(first, second)
+    # Hits hand back a private copy, never the cached buffer itself.
+    assert second.base is None
+
+
+def test_list_voices_snapshot_without_model_load():
+    from app.model_manager import ModelManager
+
+    manager = ModelManager()
+    voices = manager.available_voices("qwen3-tts-0.6b")
+    # Snapshot is served from the defaults; no wrapper was loaded.
+    assert manager.models == {}
+    assert "vivian" in voices
+    assert "female" in voices  # aliases included
@@ -0,0 +1,117 @@
+import numpy as np
+
+from app.utils_audio import (
+    apply_speed,
+    fold_mono_normalize,
+    quantize_int16,
+    resample_audio,
+)
+
+
+def test_apply_speed_changes_length():
+    audio = np.sin(np.linspace(0, 20 * np.pi, 24000)).astype(np.float32)
+    slowed = apply_speed(audio, 0.5)
+    sped = apply_speed(audio, 2.0)
+    assert abs(len(slowed) - 48000) <= 2
+    assert abs(len(sped) - 12000) <= 2
+    assert slowed.dtype == audio.dtype
+    # identity speed returns the input untouched
+    assert apply_speed(audio, 1.0) is audio
+
+
+def test_resample_audio_ratio_and_dtype():
+    audio = np.sin(np.linspace(0, 20 * np.pi, 24000)).astype(np.float32)
+    resampled = resample_audio(audio, 24000, 16000)
+    assert abs(len(resampled) - 16000) <= 2
+    assert resampled.dtype == audio.dtype
+    assert resample_audio(audio, 24000, 24000) is audio
+
+
+def test_ensure_mono_folds_stereo():
+    from app.utils_audio import ensure_mono
+
+    stereo = np.stack(
+        [np.full(64, 0.2, dtype=np.float32), np.full(64, 0.6, dtype=np.float32)],
+        axis=1,
+    )
+    mono = ensure_mono(stereo)
+    assert mono.shape == (64,)
+    np.testing.assert_allclose(mono, 0.4, rtol=1e-6)
+    # 1-D input passes through untouched
+    flat = np.zeros(10, dtype=np.float32)
+    assert ensure_mono(flat) is flat
+
+
+def test_fold_mono_normalize_stereo():
+    stereo = np.stack(
+        [np.full(100, 0.2, dtype=np.float32), np.full(100, 0.6, dtype=np.float32)],
+        axis=1,
+    )
+    out = np.empty(100, dtype=np.float32)
+    result = fold_mono_normalize(stereo, out)
+    assert result is out
+    # mean of 0.2/0.6 is 0.4 everywhere, so normalization lands on 1.0
+    np.testing.assert_allclose(result, 1.0, rtol=1e-6)
+
+
+def test_fold_mono_normalize_silence_passthrough():
+    out = np.empty(50, dtype=np.float32)
+    result = fold_mono_normalize(np.zeros(50, dtype=np.float32), out)
+    assert np.all(result == 0.0)
+
+
+def test_waveform_to_wav_bytes_fast_matches_soundfile():
+    import io
+
+    import soundfile as sf
+
+    from app.utils_audio import waveform_to_wav_bytes_fast
+
+    pcm = (np.sin(np.linspace(0, 4 * np.pi, 2400)) * 20000).astype(np.int16)
+    wav = waveform_to_wav_bytes_fast(pcm, 24000)
+    assert wav.startswith(b"RIFF")
+    decoded, sr = sf.read(io.BytesIO(wav), dtype="int16")
+    assert sr == 24000
+    np.testing.assert_array_equal(decoded, pcm)
+
+
+def test_pcm16_to_mp3_bytes_roundtrip():
+    import pytest
+
+    from app.utils_audio import FFMPEG_BIN, pcm16_to_mp3_bytes
+
+    if FFMPEG_BIN is None:
+        pytest.skip("ffmpeg not installed")
+    pcm = (np.sin(np.linspace(0, 40 * np.pi, 24000)) * 20000).astype(np.int16)
+    mp3 = pcm16_to_mp3_bytes(pcm, 24000)
+    assert len(mp3) > 0
+    # MPEG frame sync or ID3 tag at the head
+    assert mp3[:3] == b"ID3" or mp3[0] == 0xFF
+
+
+def test_normalize_waveform_skips_near_unity_peaks():
+    from app.utils_audio import normalize_waveform
+
+    near_unity = np.array([0.0, 0.5, -0.98], dtype=np.float32)
+    assert normalize_waveform(near_unity) is near_unity
+    silence = np.zeros(8, dtype=np.float32)
+    assert normalize_waveform(silence) is silence
+    # Peaks above 1.0 must be scaled down or they hard-clip in int16.
+    over_unity = np.array([0.0, 1.02], dtype=np.float32)
+    np.testing.assert_allclose(
+        normalize_waveform(over_unity), [0.0, 1.0], rtol=1e-6
+    )
+    quiet = np.array([0.0, 0.25, -0.5], dtype=np.float32)
+    np.testing.assert_allclose(
+        normalize_waveform(quiet), [0.0, 0.5, -1.0], rtol=1e-6
+    )
+
+
+def test_quantize_int16_clips_and_scales():
+    audio = np.array([0.0, 0.5, 1.0, -1.0, 2.0, -2.0], dtype=np.float32)
+    pcm = quantize_int16(audio)
+    assert pcm.dtype == np.int16
+    assert pcm[0] == 0
+    assert pcm[2] == 32767
+    assert pcm[4] == 32767  # clipped, not wrapped
+    assert pcm[5] == -32768
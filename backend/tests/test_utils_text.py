@@ -0,0 +1,27 @@
+from app.utils_text import split_for_tts
+
+
+def test_short_text_not_split():
+    assert split_for_tts("hello world") == ["hello world"]
+
+
+def test_split_on_sentence_boundaries():
+    text = ("First sentence about something. " * 4 + "Second part here. " * 4).strip()
+    chunks = split_for_tts(text, lam_plus=80, lam_minus=20)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 80 for chunk in chunks)
+    # Nothing is lost or reordered.
+    assert " ".join(chunks) == text
+
+
+def test_long_sentence_split_at_whitespace():
+    text = "word " * 100
+    chunks = split_for_tts(text.strip(), lam_plus=120, lam_minus=20)
+    assert len(chunks) > 1
+    assert all(" " not in (chunk[0], chunk[-1]) for chunk in chunks)
+
+
+def test_tiny_fragments_merged():
+    text = "Hi. " * 30
+    chunks = split_for_tts(text.strip(), lam_plus=60, lam_minus=20)
+    assert all(len(chunk) >= 20 or chunk is chunks[-1] for chunk in chunks)
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from app.worker import ModelWorker, QueueFullError, SynthesisTask
+
+
+def test_worker_batches_queued_tasks():
+    calls = []
+
+    async def run_fn(payload):
+        calls.append(1)
+        return payload["x"]
+
+    async def run_batch_fn(payloads):
+        calls.append(len(payloads))
+        return [payload["x"] for payload in payloads]
+
+    async def scenario():
+        worker = ModelWorker(
+            run_fn=run_fn,
+            max_queue=8,
+            workers=1,
+            run_batch_fn=run_batch_fn,
+            max_batch=4,
+        )
+        loop = asyncio.get_running_loop()
+        tasks = [
+            SynthesisTask(payload={"x": i}, future=loop.create_future())
+            for i in range(3)
+        ]
+        for task in tasks:
+            worker.queue.async_q.put_nowait(task)
+        await worker.start()
+        return await asyncio.gather(*[task.future for task in tasks])
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    # All three queued tasks were drained into a single batched call.
+    assert calls == [3]
+
+
+def test_worker_single_task_uses_run_fn():
+    calls = []
+
+    async def run_fn(payload):
+        calls.append("single")
+        return payload["x"]
+
+    async def run_batch_fn(payloads):
+        calls.append("batch")
+        return [payload["x"] for payload in payloads]
+
+    async def scenario():
+        worker = ModelWorker(
+            run_fn=run_fn,
+            max_queue=8,
+            workers=1,
+            run_batch_fn=run_batch_fn,
+            max_batch=4,
+        )
+        await worker.start()
+        return await worker.enqueue({"x": 7})
+
+    assert asyncio.run(scenario()) == 7
+    assert calls == ["single"]
+
+
+def test_worker_batch_window_collects_stragglers():
+    calls = []
+
+    async def run_fn(payload):
+        calls.append(1)
+        return payload["x"]
+
+    async def run_batch_fn(payloads):
+        calls.append(len(payloads))
+        return [payload["x"] for payload in payloads]
+
+    async def scenario():
+        worker = ModelWorker(
+            run_fn=run_fn,
+            max_queue=8,
+            workers=1,
+            run_batch_fn=run_batch_fn,
+            max_batch=4,
+            batch_window_s=0.05,
+        )
+        await worker.start()
+        first = asyncio.ensure_future(worker.enqueue({"x": 1}))
+        # Arrives after the worker dequeued the first task but well
+        # inside the fill window.
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(worker.enqueue({"x": 2}))
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert calls == [2]
+
+
+def test_worker_survives_cancelled_futures():
+    async def run_fn(payload):
+        return payload["x"]
+
+    async def run_batch_fn(payloads):
+        return [payload["x"] for payload in payloads]
+
+    async def scenario():
+        worker = ModelWorker(
+            run_fn=run_fn,
+            max_queue=8,
+            workers=1,
+            run_batch_fn=run_batch_fn,
+            max_batch=4,
+        )
+        loop = asyncio.get_running_loop()
+        cancelled = SynthesisTask(payload={"x": 0}, future=loop.create_future())
+        alive = SynthesisTask(payload={"x": 1}, future=loop.create_future())
+        cancelled.future.cancel()
+        worker.queue.async_q.put_nowait(cancelled)
+        worker.queue.async_q.put_nowait(alive)
+        await worker.start()
+        # The co-batched live future still gets its result, and the loop
+        # stays healthy enough to serve a fresh enqueue afterwards.
+        assert await alive.future == 1
+        return await worker.enqueue({"x": 2})
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_worker_enqueue_rejects_when_full():
+    async def run_fn(payload):
+        return payload
+
+    async def scenario():
+        worker = ModelWorker(run_fn=run_fn, max_queue=1, workers=1)
+        loop = asyncio.get_running_loop()
+        # Fill the queue without starting the worker so nothing drains.
+        worker.queue.async_q.put_nowait(
+            SynthesisTask(payload={}, future=loop.create_future())
+        )
+        with pytest.raises(QueueFullError):
+            await worker.enqueue({})
+
+    asyncio.run(scenario())